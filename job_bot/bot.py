@@ -2,29 +2,78 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from contextlib import contextmanager
-from dataclasses import asdict
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Mapping
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
+
+from .config import (
+    DEFAULT_CHROMIUM_ARGS,
+    AutomationConfig,
+    JobConfig,
+    ParallelStepConfig,
+    StepConfig,
+    compile_template,
+)
 
-from jinja2 import Environment
-from playwright.sync_api import Browser, Page, TimeoutError as PlaywrightTimeoutError, sync_playwright
+LOGGER = logging.getLogger("job_bot")
 
-from .config import AutomationConfig, JobConfig
 
-LOGGER = logging.getLogger("job_bot")
-if not LOGGER.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("[%(levelname)s] %(message)s")
-    handler.setFormatter(formatter)
-    LOGGER.addHandler(handler)
-LOGGER.setLevel(logging.INFO)
+def _configure_logging() -> None:
+    """Attach the default handler on first use rather than at import time."""
+
+    if not LOGGER.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter("[%(levelname)s] %(message)s")
+        handler.setFormatter(formatter)
+        LOGGER.addHandler(handler)
+    if LOGGER.level == logging.NOTSET:
+        LOGGER.setLevel(logging.INFO)
+
+
+# Contexts closed concurrently per wake-up of the background reaper.
+_REAP_BATCH_SIZE = 8
+
+# Run on a job's page before its context returns to the pool, so drafts or
+# login state saved by the site do not leak into the next job.
+_CLEAR_ORIGIN_STORAGE = """async () => {
+    try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}
+    try {
+        for (const db of await indexedDB.databases()) {
+            if (db.name) indexedDB.deleteDatabase(db.name);
+        }
+    } catch (e) {}
+    try {
+        for (const reg of await navigator.serviceWorker.getRegistrations()) {
+            await reg.unregister();
+        }
+    } catch (e) {}
+    try {
+        for (const key of await caches.keys()) await caches.delete(key);
+    } catch (e) {}
+}"""
 
 
 class JobAutomationError(RuntimeError):
     """Raised when automation fails for a job."""
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_path(base_dir: Path, relative: str) -> str:
+    return str((base_dir / relative).expanduser().resolve())
+
+
 class JobApplicationBot:
     """Execute job application flows using Playwright."""
 
@@ -34,12 +83,13 @@ class JobApplicationBot:
         *,
         headless: bool | None = None,
     ) -> None:
+        _configure_logging()
         self._config = config
         self._headless_override = headless
-        self._jinja_env = Environment(autoescape=False)
-        self._jinja_env.globals.update(
-            path=self._path_helper,
-        )
+        # Checked before per-step log calls so that, when INFO is filtered,
+        # the hot loops skip building log records entirely.
+        self._info_enabled = LOGGER.isEnabledFor(logging.INFO)
+        self._ctx_pool: Dict[tuple, asyncio.Queue[BrowserContext]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -47,6 +97,11 @@ class JobApplicationBot:
     def run(self, *, dry_run: bool = False) -> None:
         """Run every job listed in the configuration."""
 
+        asyncio.run(self.run_async(dry_run=dry_run))
+
+    async def run_async(self, *, dry_run: bool = False) -> None:
+        """Run every job concurrently, at most ``browser.max_parallel`` at a time."""
+
         context = self._build_template_context()
 
         if dry_run:
@@ -57,98 +112,266 @@ class JobApplicationBot:
             "headless": self._headless_override
             if self._headless_override is not None
             else self._config.browser.headless,
+            "args": self._config.browser.chromium_args,
         }
         if self._config.browser.slow_mo is not None:
             browser_kwargs["slow_mo"] = self._config.browser.slow_mo
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(**browser_kwargs)
+        cdp_endpoint = self._config.browser.cdp_endpoint
+        async with async_playwright() as playwright:
+            if cdp_endpoint:
+                # Reuse an already running browser (see ``job-bot serve``);
+                # it is left running when the jobs are done.
+                LOGGER.info("Connecting to browser at %s", cdp_endpoint)
+                browser = await playwright.chromium.connect_over_cdp(
+                    cdp_endpoint,
+                    slow_mo=self._config.browser.slow_mo,
+                )
+            else:
+                browser = await playwright.chromium.launch(**browser_kwargs)
+            semaphore = asyncio.Semaphore(self._config.browser.max_parallel)
+            # Created per run: asyncio queues bind to the loop that first waits
+            # on them, and every ``run()`` gets a fresh loop.
+            closing: asyncio.Queue[BrowserContext] = asyncio.Queue()
+            reaper = asyncio.create_task(self._reap_contexts(closing))
             try:
-                for job in self._config.jobs:
-                    LOGGER.info("Running job '%s' (%s)", job.name, job.url)
-                    try:
-                        with self._job_context(browser) as page:
-                            self._execute_job(job, page, context)
-                    except JobAutomationError:
-                        raise
-                    except Exception as exc:  # pragma: no cover - defensive
-                        raise JobAutomationError(
-                            f"Job '{job.name}' failed with unexpected error"
-                        ) from exc
+                results = await asyncio.gather(
+                    *[
+                        self._run_job_async(browser, job, context, semaphore, closing)
+                        for job in self._config.jobs
+                    ],
+                    return_exceptions=True,
+                )
             finally:
-                browser.close()
+                self._drain_context_pool(closing)
+                await closing.join()
+                reaper.cancel()
+                with suppress(asyncio.CancelledError):
+                    await reaper
+                if not cdp_endpoint:
+                    await browser.close()
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            # The first failure is raised for the caller to report; the rest
+            # would otherwise be lost, so they are logged here.
+            for failure in failures[1:]:
+                LOGGER.error("%s", failure)
+            raise failures[0]
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _build_template_context(self) -> Dict[str, Any]:
         raw_profile = dict(self._config.profile)
-        preliminary_context = {"profile": raw_profile}
+        preliminary_context = {"profile": raw_profile, "path": self._path_helper}
         rendered_profile = self._render(raw_profile, preliminary_context)
-        return {"profile": rendered_profile}
+        return {"profile": rendered_profile, "path": self._path_helper}
+
+    @staticmethod
+    def _job_template_context(job: JobConfig, context: Mapping[str, Any]) -> Dict[str, Any]:
+        # Shallow by design: steps are not part of the template context.
+        return {**context, "job": {"name": job.name, "url": job.url, **job.metadata}}
 
     def _path_helper(self, relative: str) -> str:
-        path = (self._config.base_dir / relative).expanduser().resolve()
-        return str(path)
+        return _resolve_path(self._config.base_dir, relative)
 
     def _render(self, value: Any, context: Mapping[str, Any]) -> Any:
         if isinstance(value, str):
-            template = self._jinja_env.from_string(value)
-            return template.render(**context)
+            if "{{" not in value and "{%" not in value and "{#" not in value:
+                return value
+            return compile_template(value).render(context)
         if isinstance(value, Mapping):
             return {k: self._render(v, context) for k, v in value.items()}
-        if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
+        if isinstance(value, (list, tuple)):
             return [self._render(item, context) for item in value]
         return value
 
     def _dry_run(self, context: Mapping[str, Any]) -> None:
+        # Steps are rendered even when INFO is filtered so that template
+        # errors still surface; only the log records are skipped.
+        info_enabled = self._info_enabled
         for job in self._config.jobs:
-            LOGGER.info("[dry-run] Job '%s' -> %s", job.name, job.url)
-            job_context = {**context, "job": asdict(job)}
+            if info_enabled:
+                LOGGER.info("[dry-run] Job '%s' -> %s", job.name, job.url)
+            job_context = self._job_template_context(job, context)
             for index, step in enumerate(job.steps, start=1):
-                rendered = self._render({"action": step.action, **step.options}, job_context)
-                LOGGER.info("  Step %02d: %s", index, rendered)
+                if isinstance(step, ParallelStepConfig):
+                    if info_enabled:
+                        LOGGER.info("  Step %02d: parallel", index)
+                    for sub_index, sub_step in enumerate(step.steps, start=1):
+                        rendered = sub_step.render(job_context)
+                        if info_enabled:
+                            LOGGER.info("  Step %02d.%d: %s %s", index, sub_index, sub_step.action, dict(rendered))
+                    continue
+                rendered = step.render(job_context)
+                if info_enabled:
+                    LOGGER.info("  Step %02d: %s %s", index, step.action, dict(rendered))
+
+    async def _run_job_async(
+        self,
+        browser: Browser,
+        job: JobConfig,
+        context: Mapping[str, Any],
+        semaphore: asyncio.Semaphore,
+        closing: asyncio.Queue[BrowserContext],
+    ) -> None:
+        async with semaphore:
+            LOGGER.info("Running job '%s' (%s)", job.name, job.url)
+            try:
+                async with self._job_context(browser, closing) as page:
+                    await self._execute_job(job, page, context)
+            except JobAutomationError as exc:
+                raise JobAutomationError(f"Job '{job.name}' failed: {exc}") from exc
+            except Exception as exc:
+                raise JobAutomationError(
+                    f"Job '{job.name}' failed with unexpected error: {exc}"
+                ) from exc
 
-    @contextmanager
-    def _job_context(self, browser: Browser) -> Iterable[Page]:
+    @asynccontextmanager
+    async def _job_context(
+        self,
+        browser: Browser,
+        closing: asyncio.Queue[BrowserContext],
+    ) -> AsyncIterator[Page]:
         kwargs = {}
         if self._config.browser.locale:
             kwargs["locale"] = self._config.browser.locale
-        context = browser.new_context(**kwargs)
+        key = tuple(sorted(kwargs.items()))
+        pool = self._ctx_pool.get(key)
+        if pool is None:
+            pool = self._ctx_pool[key] = asyncio.Queue(maxsize=self._config.browser.max_parallel)
+        fresh = False
+        try:
+            context = pool.get_nowait()
+        except asyncio.QueueEmpty:
+            context = await browser.new_context(**kwargs)
+            fresh = True
+        try:
+            if fresh and self._config.browser.block_resources:
+                # Registered once per context; it stays active across reuses.
+                await context.route("**/*", self._route_request)
+            page = await context.new_page()
+        except BaseException:
+            # The context cannot be set up or open pages, so it is not worth pooling.
+            closing.put_nowait(context)
+            raise
         try:
-            page = context.new_page()
             yield page
         finally:
-            context.close()
+            await self._release_context(pool, context, page, closing)
+
+    async def _route_request(self, route: Route) -> None:
+        if route.request.resource_type in self._config.browser.block_resources:
+            await route.abort()
+        else:
+            await route.continue_()
 
-    def _execute_job(
+    async def _release_context(
+        self,
+        pool: asyncio.Queue[BrowserContext],
+        context: BrowserContext,
+        page: Page,
+        closing: asyncio.Queue[BrowserContext],
+    ) -> None:
+        try:
+            # Cookies and permissions are context-wide, but web storage is per
+            # origin and can only be cleared from a page on that origin.
+            await page.evaluate(_CLEAR_ORIGIN_STORAGE)
+            await asyncio.gather(
+                page.close(),
+                context.clear_cookies(),
+                context.clear_permissions(),
+            )
+            pool.put_nowait(context)
+        except Exception:  # QueueFull, or the context is no longer usable
+            closing.put_nowait(context)
+
+    def _drain_context_pool(self, closing: asyncio.Queue[BrowserContext]) -> None:
+        for pool in self._ctx_pool.values():
+            while not pool.empty():
+                closing.put_nowait(pool.get_nowait())
+        self._ctx_pool.clear()
+
+    @staticmethod
+    async def _reap_contexts(closing: asyncio.Queue[BrowserContext]) -> None:
+        """Close retired contexts in the background, a batch at a time."""
+
+        while True:
+            batch = [await closing.get()]
+            while len(batch) < _REAP_BATCH_SIZE and not closing.empty():
+                batch.append(closing.get_nowait())
+            await asyncio.gather(*(context.close() for context in batch), return_exceptions=True)
+            for _ in batch:
+                closing.task_done()
+
+    async def _execute_job(
         self,
         job: JobConfig,
         page: Page,
         global_context: Mapping[str, Any],
     ) -> None:
-        job_context = {**global_context, "job": {"name": job.name, **job.metadata}}
+        job_context = self._job_template_context(job, global_context)
         timeout_ms = self._config.browser.timeout_ms
 
-        self._goto(page, job.url, timeout_ms)
+        await self._goto(page, job.url, timeout_ms)
 
         for index, step in enumerate(job.steps, start=1):
-            rendered_step = self._render({"action": step.action, **step.options}, job_context)
-            action = rendered_step.pop("action")
-            LOGGER.info("  step %02d -> %s", index, action)
-            handler = ACTION_HANDLERS.get(action)
-            if not handler:
-                raise JobAutomationError(f"Unsupported action '{action}'")
-            try:
-                handler(page, rendered_step, timeout_ms, self)
-            except PlaywrightTimeoutError as exc:
-                raise JobAutomationError(
-                    f"Timed out waiting for selector during step {index} ({action})"
-                ) from exc
+            if isinstance(step, ParallelStepConfig):
+                # Actions on different selectors can overlap their waits on
+                # the same page; the first failure is raised once all settle.
+                results = await asyncio.gather(
+                    *[
+                        self._execute_step(page, sub_step, f"{index:02d}.{sub_index}", job_context, timeout_ms)
+                        for sub_index, sub_step in enumerate(step.steps, start=1)
+                    ],
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+            else:
+                await self._execute_step(page, step, f"{index:02d}", job_context, timeout_ms)
+
+    async def _execute_step(
+        self,
+        page: Page,
+        step: StepConfig,
+        label: str,
+        job_context: Mapping[str, Any],
+        timeout_ms: int,
+    ) -> None:
+        rendered_step = step.render(job_context)
+        if self._info_enabled:
+            LOGGER.info("  step %s -> %s", label, step.action)
+        try:
+            await step.handler(page, rendered_step, timeout_ms, self)
+        except PlaywrightTimeoutError as exc:
+            raise JobAutomationError(
+                f"Timed out waiting for selector during step {label} ({step.action})"
+            ) from exc
 
-    def _goto(self, page: Page, url: str, timeout_ms: int) -> None:
+    async def _goto(self, page: Page, url: str, timeout_ms: int) -> None:
         LOGGER.info("  navigating to %s", url)
-        page.goto(url, wait_until="load", timeout=timeout_ms)
+        # Waiting for DOM readiness is enough: the action handlers rely on
+        # Playwright's actionability checks to wait for their elements.
+        await page.goto(url, wait_until=self._config.browser.nav_wait_until, timeout=timeout_ms)
+
+
+async def serve_browser(port: int = 9222, *, headless: bool = True) -> None:
+    """Run a Chromium instance with remote debugging enabled until cancelled."""
+
+    _configure_logging()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            args=[*DEFAULT_CHROMIUM_ARGS, f"--remote-debugging-port={port}"],
+        )
+        LOGGER.info("Serving Chromium at http://localhost:%d (press Ctrl+C to stop)", port)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await browser.close()
 
 
 # ----------------------------------------------------------------------
@@ -156,60 +379,49 @@ class JobApplicationBot:
 # ----------------------------------------------------------------------
 
 
-def _require_selector(step: MutableMapping[str, Any]) -> str:
+def _require_selector(step: Mapping[str, Any]) -> str:
     selector = step.get("selector")
     if not selector:
         raise JobAutomationError("Step requires a 'selector'")
-    return str(selector)
-
-
-def _ensure_files(bot: JobApplicationBot, value: Any) -> List[str]:
-    if isinstance(value, (list, tuple)):
-        files = [str(v) for v in value]
-    else:
-        files = [str(value)]
-    return [bot._path_helper(path) for path in files]
+    return selector
 
 
-def handle_fill(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_fill(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
-    if "value" not in step:
-        raise JobAutomationError("Fill action requires a 'value'")
     value = step.get("value")
-    page.fill(selector, str(value), timeout=timeout_ms)
+    if value is None:
+        raise JobAutomationError("Fill action requires a 'value'")
+    await page.fill(selector, value, timeout=timeout_ms)
 
 
-def handle_type(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_type(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
-    value = step.get("value", "")
+    value = step.get("value")
     delay = step.get("delay")
     kwargs = {"timeout": timeout_ms}
     if delay is not None:
-        kwargs["delay"] = int(delay)
-    page.type(selector, str(value), **kwargs)
+        kwargs["delay"] = delay
+    await page.type(selector, value if value is not None else "", **kwargs)
 
 
-def handle_click(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_click(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
     kwargs = {"timeout": timeout_ms}
-    if "button" in step:
-        kwargs["button"] = str(step["button"])
-    if "click_count" in step:
-        kwargs["click_count"] = int(step["click_count"])
-    if "delay" in step:
-        kwargs["delay"] = int(step["delay"])
-    page.click(selector, **kwargs)
+    for option in ("button", "click_count", "delay"):
+        if step.get(option) is not None:
+            kwargs[option] = step[option]
+    await page.click(selector, **kwargs)
 
 
-def handle_check(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_check(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
     if step.get("checked", True):
-        page.check(selector, timeout=timeout_ms)
+        await page.check(selector, timeout=timeout_ms)
     else:
-        page.uncheck(selector, timeout=timeout_ms)
+        await page.uncheck(selector, timeout=timeout_ms)
 
 
-def handle_select(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_select(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
     value = step.get("value")
     values = step.get("values")
@@ -217,73 +429,70 @@ def handle_select(page: Page, step: MutableMapping[str, Any], timeout_ms: int, b
         raise JobAutomationError("Select action requires 'value' or 'values'")
     kwargs: Dict[str, Any] = {"timeout": timeout_ms}
     if value is not None:
-        kwargs["value"] = str(value)
+        kwargs["value"] = value
     if values is not None:
-        if isinstance(values, Iterable) and not isinstance(values, str):
-            kwargs["values"] = [str(v) for v in values]
-        else:
-            kwargs["values"] = [str(values)]
-    page.select_option(selector, **kwargs)
+        kwargs["values"] = values
+    await page.select_option(selector, **kwargs)
 
 
-def handle_upload(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_upload(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
-    if "files" not in step:
+    if step.get("files") is None:
         raise JobAutomationError("Upload action requires 'files'")
-    files = _ensure_files(bot, step.get("files"))
-    page.set_input_files(selector, files, timeout=timeout_ms)
+    files = [bot._path_helper(path) for path in step["files"]]
+    await page.set_input_files(selector, files, timeout=timeout_ms)
 
 
-def handle_wait(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
-    duration = int(step.get("duration_ms") or step.get("ms") or 1000)
-    page.wait_for_timeout(duration)
+async def handle_wait(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+    duration = step.get("duration_ms") or step.get("ms") or 1000
+    await page.wait_for_timeout(duration)
 
 
-def handle_wait_for_selector(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_wait_for_selector(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
     state = step.get("state")
     kwargs = {"timeout": timeout_ms}
     if state:
-        kwargs["state"] = str(state)
-    page.wait_for_selector(selector, **kwargs)
+        kwargs["state"] = state
+    await page.wait_for_selector(selector, **kwargs)
 
 
-def handle_assert_text(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_assert_text(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = step.get("selector")
     text = step.get("text")
     if text is None:
         raise JobAutomationError("assert_text requires 'text'")
     if selector:
-        locator = page.locator(str(selector))
-        locator.wait_for(state="visible", timeout=timeout_ms)
-        content = locator.inner_text()
+        locator = page.locator(selector)
+        await locator.wait_for(state="visible", timeout=timeout_ms)
+        content = await locator.inner_text()
     else:
-        content = page.content()
-    if str(text) not in content:
+        content = await page.content()
+    if text not in content:
         raise JobAutomationError(
             f"assert_text failed to find '{text}' in the page content"
         )
 
 
-def handle_press(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_press(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
     keys = step.get("keys") or step.get("key")
     if not keys:
         raise JobAutomationError("press requires 'keys' or 'key'")
-    page.press(selector, str(keys), timeout=timeout_ms)
+    await page.press(selector, keys, timeout=timeout_ms)
 
 
-def handle_hover(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_hover(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     selector = _require_selector(step)
-    page.hover(selector, timeout=timeout_ms)
+    await page.hover(selector, timeout=timeout_ms)
 
 
-def handle_goto(page: Page, step: MutableMapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
+async def handle_goto(page: Page, step: Mapping[str, Any], timeout_ms: int, bot: JobApplicationBot) -> None:
     url = step.get("url")
     if not url:
         raise JobAutomationError("goto action requires 'url'")
-    wait_until = str(step.get("wait_until", "load"))
-    page.goto(str(url), wait_until=wait_until, timeout=timeout_ms)
+    wait_until = step.get("wait_until") or bot._config.browser.nav_wait_until
+    await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
 
 
 ACTION_HANDLERS = {
@@ -301,4 +510,4 @@ ACTION_HANDLERS = {
     "hover": handle_hover,
 }
 
-__all__ = ["JobApplicationBot", "JobAutomationError", "ACTION_HANDLERS"]
+__all__ = ["JobApplicationBot", "JobAutomationError", "ACTION_HANDLERS", "serve_browser"]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from .bot import JobApplicationBot, JobAutomationError
+from .bot import JobApplicationBot, JobAutomationError, serve_browser
 from .config import load_config
 
 app = typer.Typer(add_completion=False, help="Automate job application workflows")
@@ -38,5 +39,22 @@ def run(
         raise typer.Exit(code=1) from exc
 
 
+@app.command()
+def serve(
+    port: int = typer.Option(9222, help="Remote debugging port to listen on"),
+    headless: bool = typer.Option(
+        True,
+        "--headless/--no-headless",
+        help="Run the served browser without a window",
+    ),
+) -> None:
+    """Keep a Chromium instance running for `browser.cdp_endpoint` to connect to."""
+
+    try:
+        asyncio.run(serve_browser(port, headless=headless))
+    except KeyboardInterrupt:
+        typer.echo("Browser stopped")
+
+
 if __name__ == "__main__":  # pragma: no cover
     app()
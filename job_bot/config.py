@@ -2,11 +2,233 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import re
+from contextlib import closing
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional
 
 import yaml
+from jinja2 import Environment, Template, Undefined
+
+try:  # Prefer the libyaml-backed loader when PyYAML was built with it.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+_TEMPLATE_ENV = Environment(autoescape=False)
+
+NAV_WAIT_STATES = ("commit", "domcontentloaded", "load", "networkidle")
+
+RESOURCE_TYPES = (
+    "document",
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+)
+
+DEFAULT_CHROMIUM_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+)
+
+
+# ``{{ name }}`` or ``{{ name.attr.attr }}`` with nothing else inside the braces.
+_SIMPLE_VARIABLE = re.compile(r"\{\{\s*([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*\}\}")
+
+
+class _SimpleTemplate:
+    """Render templates made only of plain variable lookups without Jinja.
+
+    Lookups follow Jinja's attribute-then-item rule. When one cannot be
+    resolved the full Jinja template is used instead, so undefined values
+    behave exactly as they would under Jinja.
+    """
+
+    __slots__ = ("_source", "_chunks", "_lookups", "_jinja")
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+        # Jinja drops a single trailing newline from the template source.
+        pieces = _SIMPLE_VARIABLE.split(source[:-1] if source.endswith("\n") else source)
+        self._chunks = pieces[0::2]
+        self._lookups = [tuple(name.split(".")) for name in pieces[1::2]]
+        self._jinja: Optional[Template] = None
+
+    def render(self, ctx: Mapping[str, Any]) -> str:
+        getattr_ = _TEMPLATE_ENV.getattr
+        out = [self._chunks[0]]
+        for (root, *attrs), chunk in zip(self._lookups, self._chunks[1:]):
+            if root not in ctx:
+                return self._render_jinja(ctx)
+            value = ctx[root]
+            for attr in attrs:
+                value = getattr_(value, attr)
+                if isinstance(value, Undefined):
+                    return self._render_jinja(ctx)
+            out.append(str(value))
+            out.append(chunk)
+        return "".join(out)
+
+    def _render_jinja(self, ctx: Mapping[str, Any]) -> str:
+        if self._jinja is None:
+            self._jinja = _TEMPLATE_ENV.from_string(self._source)
+        return self._jinja.render(ctx)
+
+
+def compile_template(source: str) -> Template | _SimpleTemplate:
+    """Compile ``source`` into an object whose ``render(ctx)`` returns a string."""
+
+    remainder = _SIMPLE_VARIABLE.sub("", source)
+    if "{{" in remainder or "{%" in remainder or "{#" in remainder or "\r" in source:
+        return _TEMPLATE_ENV.from_string(source)
+    return _SimpleTemplate(source)
+
+
+def _str_list(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+# Types the built-in handlers expect for each option. Custom actions are not
+# listed and receive their options exactly as rendered.
+_ACTION_SCHEMA: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "goto": {"url": str, "wait_until": str},
+    "fill": {"selector": str, "value": str},
+    "type": {"selector": str, "value": str, "delay": int},
+    "click": {"selector": str, "button": str, "click_count": int, "delay": int},
+    "check": {"selector": str},
+    "select": {"selector": str, "value": str, "values": _str_list},
+    "upload": {"selector": str, "files": _str_list},
+    "wait": {"duration_ms": int, "ms": int},
+    "wait_for_selector": {"selector": str, "state": str},
+    "assert_text": {"selector": str, "text": str},
+    "press": {"selector": str, "keys": str, "key": str},
+    "hover": {"selector": str},
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of a literal subtree shared between renders."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _bind(namespace: Dict[str, Any], prefix: str, value: Any) -> str:
+    name = f"_{prefix}{len(namespace)}"
+    namespace[name] = value
+    return name
+
+
+def _mapping_source(entries: List[tuple[Any, Any, Optional[str]]], namespace: Dict[str, Any]) -> str:
+    items = ", ".join(
+        f"{repr(k) if isinstance(k, str) else _bind(namespace, 'k', k)}: "
+        f"{expr if expr is not None else _bind(namespace, 'c', _freeze(v))}"
+        for k, v, expr in entries
+    )
+    return "{" + items + "}"
+
+
+def _plan_expr(value: Any, namespace: Dict[str, Any]) -> Optional[str]:
+    """Return Python source rendering ``value``, or ``None`` if it holds no templates.
+
+    Compiled templates and literal subtrees are bound into ``namespace`` and
+    referenced by name from the generated expression.
+    """
+
+    if isinstance(value, str):
+        if "{{" in value or "{%" in value or "{#" in value:
+            template = _bind(namespace, "t", compile_template(value))
+            return f"{template}.render(ctx)"
+        return None
+    if isinstance(value, Mapping):
+        exprs = [(k, v, _plan_expr(v, namespace)) for k, v in value.items()]
+        if all(expr is None for _, _, expr in exprs):
+            return None
+        return _mapping_source(exprs, namespace)
+    if isinstance(value, (list, tuple)):
+        exprs = [(item, _plan_expr(item, namespace)) for item in value]
+        if all(expr is None for _, expr in exprs):
+            return None
+        items = ", ".join(
+            expr if expr is not None else _bind(namespace, "c", _freeze(item))
+            for item, expr in exprs
+        )
+        return "[" + items + "]"
+    return None
+
+
+def _rendered_coercer(action: str, key: str, coerce: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    from .bot import JobAutomationError  # imported lazily: bot imports this module
+
+    def coerce_rendered(value: Any) -> Any:
+        try:
+            return coerce(value)
+        except (TypeError, ValueError) as exc:
+            raise JobAutomationError(
+                f"Invalid value {value!r} for '{key}' in '{action}' step"
+            ) from exc
+
+    return coerce_rendered
+
+
+def _compile_render_plan(
+    action: str,
+    options: Dict[str, Any],
+) -> Callable[[Mapping[str, Any]], Mapping[str, Any]]:
+    """Generate a function rendering ``options`` for a template context.
+
+    The shape of the options is fixed once loaded, so the traversal is done
+    here and the generated function only calls the templates it needs.
+    Options listed in ``_ACTION_SCHEMA`` are coerced now when literal and
+    right after rendering otherwise. Literal parts are shared between
+    renders, so they are frozen into read-only mappings and tuples.
+    """
+
+    schema = _ACTION_SCHEMA.get(action, {})
+    namespace: Dict[str, Any] = {}
+    entries = []
+    for key, value in options.items():
+        coerce = schema.get(key)
+        expr = _plan_expr(value, namespace)
+        if expr is None:
+            if coerce is not None and value is not None:
+                try:
+                    value = coerce(value)
+                except (TypeError, ValueError) as exc:
+                    raise ValueError(
+                        f"Invalid value {value!r} for '{key}' in '{action}' step"
+                    ) from exc
+        elif coerce is not None:
+            expr = f"{_bind(namespace, 'f', _rendered_coercer(action, key, coerce))}({expr})"
+        entries.append((key, value, expr))
+
+    if all(expr is None for _, _, expr in entries):
+        literal = MappingProxyType({key: _freeze(value) for key, value, _ in entries})
+        return lambda ctx: literal
+    source = f"def _render_step(ctx):\n    return {_mapping_source(entries, namespace)}\n"
+    exec(compile(source, "<job_bot step>", "exec"), namespace)
+    return namespace["_render_step"]
 
 
 @dataclass(slots=True)
@@ -17,6 +239,11 @@ class BrowserConfig:
     slow_mo: Optional[int] = None
     timeout_ms: int = 10_000
     locale: Optional[str] = None
+    max_parallel: int = 4
+    nav_wait_until: str = "domcontentloaded"
+    chromium_args: List[str] = field(default_factory=lambda: list(DEFAULT_CHROMIUM_ARGS))
+    cdp_endpoint: Optional[str] = None
+    block_resources: FrozenSet[str] = frozenset()
 
 
 @dataclass(slots=True)
@@ -25,6 +252,20 @@ class StepConfig:
 
     action: str
     options: Dict[str, Any] = field(default_factory=dict)
+    # ``render(context)`` returns the step options rendered for ``context``.
+    render: Callable[[Mapping[str, Any]], Mapping[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+    handler: Callable[..., Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        from .bot import ACTION_HANDLERS  # imported lazily: bot imports this module
+
+        handler = ACTION_HANDLERS.get(self.action)
+        if handler is None:
+            raise ValueError(f"Unsupported action '{self.action}'")
+        self.handler = handler
+        self.render = _compile_render_plan(self.action, self.options)
 
     @classmethod
     def from_mapping(cls, data: Mapping[str, Any]) -> "StepConfig":
@@ -35,13 +276,36 @@ class StepConfig:
         return cls(action=action, options=options)
 
 
+@dataclass(slots=True)
+class ParallelStepConfig:
+    """A group of independent steps that run concurrently on the same page."""
+
+    steps: List[StepConfig]
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "ParallelStepConfig":
+        raw_steps = data["parallel"]
+        if isinstance(raw_steps, (str, Mapping)) or not isinstance(raw_steps, Iterable):
+            raise ValueError("'parallel' must be a list of step definitions")
+        steps = [StepConfig.from_mapping(step) for step in raw_steps]
+        if not steps:
+            raise ValueError("'parallel' blocks must contain at least one step")
+        return cls(steps=steps)
+
+
+def _parse_step(data: Mapping[str, Any]) -> StepConfig | ParallelStepConfig:
+    if "parallel" in data and "action" not in data:
+        return ParallelStepConfig.from_mapping(data)
+    return StepConfig.from_mapping(data)
+
+
 @dataclass(slots=True)
 class JobConfig:
     """Configuration for a single job posting automation run."""
 
     name: str
     url: str
-    steps: List[StepConfig]
+    steps: List[StepConfig | ParallelStepConfig]
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
@@ -53,7 +317,7 @@ class JobConfig:
         raw_steps = data.get("steps") or []
         if not isinstance(raw_steps, Iterable):
             raise ValueError("Job 'steps' must be an iterable of step definitions")
-        steps = [StepConfig.from_mapping(step) for step in raw_steps]
+        steps = [_parse_step(step) for step in raw_steps]
         metadata = {
             k: v
             for k, v in data.items()
@@ -76,20 +340,62 @@ class AutomationConfig:
         return self.source_path.parent
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
-        if not isinstance(data, Mapping):
-            raise ValueError("Configuration root must be a mapping")
-        return dict(data)
+class _NamedStream:
+    """Expose ``read`` of a memory map with a ``name`` for YAML error marks."""
+
+    __slots__ = ("read", "name")
+
+    def __init__(self, mm: mmap.mmap, name: str) -> None:
+        self.read = mm.read
+        self.name = name
+
+
+def _iter_yaml_documents(path: Path) -> Iterator[Any]:
+    """Yield each YAML document in ``path``, parsed straight from a memory map."""
+
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from yaml.load_all(_NamedStream(mm, str(path)), Loader=_YamlLoader)
+
+
+def _parse_jobs(raw_jobs: Any, cfg_path: Path) -> List[JobConfig]:
+    if isinstance(raw_jobs, (str, Mapping)) or not isinstance(raw_jobs, Iterable):
+        raise ValueError("'jobs' must be a list of job definitions")
+    try:
+        return [JobConfig.from_mapping(job) for job in raw_jobs]
+    except ValueError as exc:
+        raise ValueError(f"{cfg_path}: {exc}") from exc
 
 
 def _parse_browser_config(data: Mapping[str, Any]) -> BrowserConfig:
+    nav_wait_until = str(data.get("nav_wait_until", "domcontentloaded"))
+    if nav_wait_until not in NAV_WAIT_STATES:
+        raise ValueError(
+            f"'nav_wait_until' must be one of {', '.join(NAV_WAIT_STATES)}"
+        )
+    chromium_args = data.get("chromium_args", DEFAULT_CHROMIUM_ARGS)
+    if isinstance(chromium_args, str) or not isinstance(chromium_args, Iterable):
+        raise ValueError("'chromium_args' must be a list of command line flags")
+    block_resources = data.get("block_resources") or []
+    if isinstance(block_resources, str) or not isinstance(block_resources, Iterable):
+        raise ValueError("'block_resources' must be a list of resource types")
+    unknown = set(map(str, block_resources)) - set(RESOURCE_TYPES)
+    if unknown:
+        raise ValueError(
+            f"Unknown resource types in 'block_resources': {', '.join(sorted(unknown))}"
+        )
     return BrowserConfig(
         headless=bool(data.get("headless", True)),
         slow_mo=data.get("slow_mo"),
         timeout_ms=int(data.get("timeout_ms", 10_000)),
         locale=data.get("locale"),
+        max_parallel=max(1, int(data.get("max_parallel", 4))),
+        nav_wait_until=nav_wait_until,
+        chromium_args=[str(arg) for arg in chromium_args],
+        cdp_endpoint=data.get("cdp_endpoint"),
+        block_resources=frozenset(map(str, block_resources)),
     )
 
 
@@ -97,19 +403,29 @@ def load_config(path: Path | str) -> AutomationConfig:
     """Load the YAML configuration into dataclasses."""
 
     cfg_path = Path(path).expanduser().resolve()
-    raw = _load_yaml(cfg_path)
-
-    profile = raw.get("profile") or {}
-    if not isinstance(profile, Mapping):
-        raise ValueError("'profile' must be a mapping of reusable data")
-    profile = dict(profile)
-
-    browser = _parse_browser_config(raw.get("browser") or {})
+    with closing(_iter_yaml_documents(cfg_path)) as documents:
+        raw = next(documents, None) or {}
+        if not isinstance(raw, Mapping):
+            raise ValueError("Configuration root must be a mapping")
 
-    raw_jobs = raw.get("jobs") or []
-    if not isinstance(raw_jobs, Iterable):
-        raise ValueError("'jobs' must be a list of job definitions")
-    jobs = [JobConfig.from_mapping(job) for job in raw_jobs]
+        profile = raw.get("profile") or {}
+        if not isinstance(profile, Mapping):
+            raise ValueError("'profile' must be a mapping of reusable data")
+        profile = dict(profile)
+
+        browser = _parse_browser_config(raw.get("browser") or {})
+
+        jobs = _parse_jobs(raw.get("jobs") or [], cfg_path)
+        # Further documents only add jobs. Each one is converted before the
+        # next is parsed, so large job lists never sit in memory as raw YAML.
+        for document in documents:
+            if isinstance(document, Mapping):
+                if set(document) - {"jobs"}:
+                    raise ValueError(
+                        f"{cfg_path}: additional YAML documents may only define 'jobs'"
+                    )
+                document = document.get("jobs")
+            jobs.extend(_parse_jobs(document or [], cfg_path))
 
     if not jobs:
         raise ValueError("No jobs defined in configuration")
@@ -126,6 +442,7 @@ __all__ = [
     "AutomationConfig",
     "BrowserConfig",
     "JobConfig",
+    "ParallelStepConfig",
     "StepConfig",
     "load_config",
 ]